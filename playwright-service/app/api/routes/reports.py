@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from fastapi.responses import FileResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Optional
@@ -452,6 +452,30 @@ async def list_downloaded_files(api_key: str = Depends(verify_api_key)):
     }
 
 
+@router.post("/files/cleanup")
+async def cleanup_downloaded_files(
+    max_age_days: Optional[int] = Query(None, ge=1),
+    api_key: str = Depends(verify_api_key)
+):
+    """
+    Queue downloaded report files older than max_age_days for deletion.
+    
+    Files are removed by the background deletion worker, so this returns
+    immediately with the number of files queued.
+    """
+    from app.services.file_manager import get_file_manager
+    
+    file_manager = get_file_manager()
+    queued = file_manager.cleanup_old_files(
+        max_age_days if max_age_days is not None else settings.download_retention_days
+    )
+    
+    return {
+        "success": True,
+        "queued": queued
+    }
+
+
 @router.get("/logs")
 async def get_download_logs(
     limit: int = 50,
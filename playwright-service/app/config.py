@@ -1,6 +1,6 @@
 from pydantic_settings import BaseSettings
 from pydantic import field_validator
-from functools import lru_cache
+from functools import cache
 
 
 class Settings(BaseSettings):
@@ -28,6 +28,10 @@ class Settings(BaseSettings):
     debug_screenshots: bool = False  # Set to True for development, False for production
     screenshot_retention_days: int = 7  # Auto-delete screenshots older than this
     
+    # Downloads cleanup
+    download_retention_days: int = 30  # Default max age for cleanup of downloaded reports
+    download_cleanup_interval: int = 600  # Seconds between background deletion batches
+    
     # Logging
     log_level: str = "INFO"
     
@@ -67,7 +71,11 @@ class Settings(BaseSettings):
         env_file_encoding = "utf-8"
 
 
-@lru_cache()
+@cache
 def get_settings() -> Settings:
     """Get cached settings instance."""
     return Settings()
+
+
+# Direct reference to the cached settings instance
+SETTINGS: Settings = get_settings()
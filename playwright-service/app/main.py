@@ -8,6 +8,7 @@ from app.config import get_settings
 from app.db.connection import init_db, close_db
 from app.api.routes import health, auth, reports, clients
 from app.services.browser_manager import BrowserManager
+from app.services.file_manager import get_file_manager
 
 # Configure structured logging
 structlog.configure(
@@ -34,6 +35,7 @@ async def lifespan(app: FastAPI):
     logger.info("Starting Playwright Service", log_level=settings.log_level)
     await init_db()
     logger.info("Database connection initialized")
+    await get_file_manager().start_deletion_worker(settings.download_cleanup_interval)
     
     yield
     
@@ -49,6 +51,13 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.warning("Error closing browser during shutdown", error=str(e))
     
+    try:
+        file_manager = get_file_manager()
+        await file_manager.stop_deletion_worker()
+        file_manager.close()
+    except Exception as e:
+        logger.warning("Error shutting down file manager", error=str(e))
+    
     await close_db()
     logger.info("Database connection closed")
 
@@ -20,6 +20,7 @@ import os
 from datetime import datetime
 
 from app.config import get_settings
+from app.services.file_manager import get_file_manager
 
 logger = structlog.get_logger()
 settings = get_settings()
@@ -221,6 +222,7 @@ class BrowserManager:
         filepath = os.path.join(settings.download_dir, filename)
         
         await download.save_as(filepath)
+        get_file_manager().invalidate_file_info(filepath)
         logger.info("Download completed", path=filepath)
         
         return filepath
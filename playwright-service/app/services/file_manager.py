@@ -8,18 +8,179 @@ Provides utilities for:
 - Excel file consolidation
 """
 
+import asyncio
+import errno
+import multiprocessing
 import os
+import re
 import shutil
-from datetime import datetime
+import stat as stat_module
+import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager
+from copy import copy
 from typing import Optional, List
 import structlog
 from openpyxl import load_workbook, Workbook
+from openpyxl.cell.cell import Cell, MergedCell
+
+try:
+    from python_calamine import CalamineWorkbook
+except ImportError:  # optional: faster values-only reads
+    CalamineWorkbook = None
 
 from app.config import get_settings
 
 logger = structlog.get_logger()
 settings = get_settings()
 
+# Timestamp formats for generated filenames and file info dicts
+_FILENAME_TIMESTAMP_FORMAT = "%Y%m%d_%H%M%S"
+_ISO_TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%S"
+
+# Maximum number of entries kept in the file info cache
+FILE_INFO_CACHE_SIZE = 4096
+
+# Seconds a path that failed to stat with ENOENT is reported missing without re-checking
+NEGATIVE_CACHE_TTL = 5.0
+
+# Combined source size below which workbooks are parsed inline; process startup
+# and pickling the payloads back cost more than they save on small exports
+PARALLEL_PARSE_MIN_BYTES = 4 * 1024 * 1024
+
+# Filename sanitization: drop invalid characters, spaces become underscores
+_FILENAME_TRANS = str.maketrans({c: None for c in '<>:"/\\|?*'} | {' ': '_'})
+_MULTI_UNDERSCORE = re.compile(r'_{2,}')
+
+# Characters not allowed in Excel sheet names are replaced with underscores
+_SHEET_NAME_TRANS = str.maketrans({c: '_' for c in '\\/*?:[]'})
+
+# Flags for opening files for a raw binary read
+_OPEN_READ_FLAGS = os.O_RDONLY | getattr(os, "O_CLOEXEC", 0) | getattr(os, "O_BINARY", 0)
+
+
+def _extract_sheet_payloads(
+    file_path: str,
+    preserve_styles: bool = True,
+    use_calamine: bool = False
+) -> list[dict]:
+    """
+    Load an Excel file and extract each sheet's contents as plain data.
+    
+    Runs in a worker process, so the result only holds picklable values:
+    cells as (row, column, value, style index) tuples, a de-duplicated
+    list of (font, fill, border, alignment, number_format) styles,
+    merged ranges and column/row dimensions.
+    
+    With preserve_styles=False each payload holds only the sheet's row
+    value tuples (see _extract_sheet_values for use_calamine).
+    """
+    if not preserve_styles:
+        return _extract_sheet_values(file_path, use_calamine)
+    
+    source_wb = load_workbook(file_path, data_only=False)
+    payloads = []
+    
+    for source_sheet in source_wb.worksheets:
+        cells = []
+        styles = []
+        style_index = {}
+        
+        for row_idx, row in enumerate(source_sheet.iter_rows(), 1):
+            for col_idx, cell in enumerate(row, 1):
+                # Skip MergedCell objects - they don't have values
+                if isinstance(cell, MergedCell):
+                    continue
+                
+                style_idx = None
+                if cell.has_style:
+                    key = tuple(cell._style)
+                    style_idx = style_index.get(key)
+                    if style_idx is None:
+                        style_idx = style_index[key] = len(styles)
+                        styles.append((
+                            copy(cell.font),
+                            copy(cell.fill),
+                            copy(cell.border),
+                            copy(cell.alignment),
+                            cell.number_format,
+                        ))
+                elif cell.value is None:
+                    # Empty unstyled cells are not written out anyway
+                    continue
+                
+                cells.append((row_idx, col_idx, cell.value, style_idx))
+        
+        payloads.append({
+            "title": source_sheet.title,
+            "cells": cells,
+            "styles": styles,
+            "merged_ranges": [str(r) for r in source_sheet.merged_cells.ranges],
+            "column_widths": {
+                col_letter: col_dim.width
+                for col_letter, col_dim in source_sheet.column_dimensions.items()
+            },
+            "row_heights": {
+                row_num: row_dim.height
+                for row_num, row_dim in source_sheet.row_dimensions.items()
+            },
+        })
+    
+    source_wb.close()
+    return payloads
+
+
+def _extract_sheet_values(file_path: str, use_calamine: bool = False) -> list[dict]:
+    """
+    Read each sheet's row values from an Excel file.
+    
+    By default streams the workbook with openpyxl in read-only mode, which
+    keeps formula text and value types as stored. With use_calamine (and
+    python-calamine installed) the faster Rust parser is used instead; it
+    yields cached formula results (None if never calculated), whole numbers
+    as floats and dates without a time as date objects.
+    """
+    if use_calamine and CalamineWorkbook is not None:
+        return _extract_sheet_values_calamine(file_path)
+    
+    source_wb = load_workbook(file_path, read_only=True, keep_links=False, data_only=False)
+    payloads = []
+    
+    for source_sheet in source_wb.worksheets:
+        # Don't trust the stored dimension; some exporters write it wrong
+        source_sheet.reset_dimensions()
+        payloads.append({
+            "title": source_sheet.title,
+            "rows": list(source_sheet.iter_rows(values_only=True)),
+        })
+    
+    source_wb.close()
+    return payloads
+
+
+def _extract_sheet_values_calamine(file_path: str) -> list[dict]:
+    """Read each sheet's row values with python-calamine."""
+    source_wb = CalamineWorkbook.from_path(file_path)
+    payloads = []
+    
+    try:
+        for title in source_wb.sheet_names:
+            # Keep leading empty rows/columns so cell positions match the source
+            rows = source_wb.get_sheet_by_name(title).to_python(skip_empty_area=False)
+            payloads.append({
+                "title": title,
+                # calamine reports empty cells as ""
+                "rows": [tuple(None if v == "" else v for v in row) for row in rows],
+            })
+    finally:
+        source_wb.close()
+    
+    return payloads
+
 
 class FileManager:
     """Manages file operations for downloaded reports."""
@@ -27,7 +188,20 @@ class FileManager:
     def __init__(self):
         self.download_dir = settings.download_dir
         self.screenshot_dir = settings.screenshot_dir
+        # LRU cache of path -> (mtime_ns, size, file info dict)
+        self._info_cache: OrderedDict = OrderedDict()
+        self._info_cache_lock = threading.Lock()
+        # path -> time.monotonic() of the last ENOENT, for repeated lookups of
+        # missing files; oldest first, bounded by FILE_INFO_CACHE_SIZE
+        self._negative_cache: OrderedDict = OrderedDict()
+        # Expired files queued for the background deletion worker, keyed by path
+        self._pending_deletions: dict[str, tuple] = {}
+        self._pending_lock = threading.Lock()
+        self._deletion_task: Optional[asyncio.Task] = None
         self._ensure_directories()
+        # Worker pool for parsing large consolidations, created on first use
+        self._parse_executor: Optional[ProcessPoolExecutor] = None
+        self._parse_executor_lock = threading.Lock()
     
     def _ensure_directories(self) -> None:
         """Ensure required directories exist."""
@@ -37,6 +211,71 @@ class FileManager:
                     download_dir=self.download_dir,
                     screenshot_dir=self.screenshot_dir)
     
+    def _open_dir_fd(self, path: str) -> Optional[int]:
+        """
+        Open a directory for use with dir_fd-relative syscalls.
+        
+        Listing, stat and unlink of downloads then resolve only the entry
+        name against the held descriptor instead of walking the full path
+        each time. Returns None where dir_fd isn't supported (e.g. Windows).
+        """
+        if (
+            not hasattr(os, "O_DIRECTORY")
+            or os.stat not in os.supports_dir_fd
+            or os.unlink not in os.supports_dir_fd
+            or os.scandir not in os.supports_fd
+        ):
+            return None
+        
+        try:
+            return os.open(path, os.O_RDONLY | os.O_DIRECTORY | getattr(os, "O_CLOEXEC", 0))
+        except OSError as e:
+            logger.warning("Could not open directory descriptor", path=path, error=str(e))
+            return None
+    
+    @contextmanager
+    def _download_dir(self):
+        """
+        Open the download directory fd for one scan or deletion batch.
+        
+        Yields the fd, or None where dir_fd isn't supported. Each caller gets
+        its own descriptor: os.scandir(fd) dups it and shares the directory
+        offset, so a shared fd would make concurrent scans skip entries. It
+        also always refers to the current download_dir, even if replaced.
+        """
+        fd = self._open_dir_fd(self.download_dir)
+        try:
+            yield fd
+        finally:
+            if fd is not None:
+                os.close(fd)
+    
+    def close(self) -> None:
+        """Stop the parse pool. It is recreated on next use."""
+        with self._parse_executor_lock:
+            if self._parse_executor is not None:
+                self._parse_executor.shutdown(cancel_futures=True)
+                self._parse_executor = None
+    
+    def _scan_download_dir(self, dir_fd: Optional[int]):
+        """Return an os.scandir iterator over the download directory."""
+        if dir_fd is None:
+            return os.scandir(self.download_dir)
+        return os.scandir(dir_fd)
+    
+    def _stat_download(self, filename: str, dir_fd: Optional[int]) -> os.stat_result:
+        """Stat a file in the download directory by name."""
+        if dir_fd is None:
+            return os.stat(os.path.join(self.download_dir, filename))
+        return os.stat(filename, dir_fd=dir_fd)
+    
+    def _unlink_download(self, filename: str, dir_fd: Optional[int]) -> None:
+        """Remove a file in the download directory by name."""
+        if dir_fd is None:
+            os.unlink(os.path.join(self.download_dir, filename))
+        else:
+            os.unlink(filename, dir_fd=dir_fd)
+    
     def generate_filename(
         self,
         report_type: str,
@@ -63,7 +302,7 @@ class FileManager:
         report_name = report_type.replace("_", " ").title().replace(" ", "_")
         
         # Build filename components
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = time.strftime(_FILENAME_TIMESTAMP_FORMAT)
         
         if period:
             filename = f"{report_name}_{safe_tenant}_{period}_{timestamp}.{extension}"
@@ -78,22 +317,10 @@ class FileManager:
         
         Removes or replaces characters that are invalid in filenames.
         """
-        # Characters to remove
-        invalid_chars = '<>:"/\\|?*'
+        result = name.translate(_FILENAME_TRANS)
         
-        result = name
-        for char in invalid_chars:
-            result = result.replace(char, '')
-        
-        # Replace spaces with underscores
-        result = result.replace(' ', '_')
-        
-        # Remove consecutive underscores
-        while '__' in result:
-            result = result.replace('__', '_')
-        
-        # Trim to reasonable length
-        return result[:100]
+        # Remove consecutive underscores, trim to reasonable length
+        return _MULTI_UNDERSCORE.sub('_', result)[:100]
     
     def rename_download(
         self,
@@ -109,41 +336,177 @@ class FileManager:
             
         Returns:
             Path to the renamed file
+            
+        Raises:
+            FileNotFoundError: If original_path does not exist
         """
-        if not os.path.exists(original_path):
-            raise FileNotFoundError(f"File not found: {original_path}")
-        
         new_path = os.path.join(self.download_dir, new_filename)
         
-        # Handle existing file
-        if os.path.exists(new_path):
+        if os.path.lexists(new_path):
             logger.warning("File already exists, will overwrite", path=new_path)
-            os.remove(new_path)
         
-        shutil.move(original_path, new_path)
+        # os.replace atomically overwrites any existing file; it only fails
+        # with EXDEV when the source is on another filesystem
+        try:
+            os.replace(original_path, new_path)
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+            self._move_across_devices(original_path, new_path)
+        
+        self.invalidate_file_info(original_path, new_path)
         logger.info("File renamed", original=original_path, new=new_path)
         
         return new_path
     
-    def get_file_info(self, filepath: str) -> dict:
+    def _move_across_devices(self, src: str, dst: str) -> None:
+        """
+        Move a file to another filesystem.
+        
+        On Linux the data is copied in-kernel with os.sendfile into a hidden
+        temporary file next to dst, which is then renamed into place so dst
+        is never seen half-written. Filesystems that don't support sendfile
+        fall back to shutil.copyfile. Other platforms use shutil.move.
+        """
+        if not sys.platform.startswith("linux"):
+            shutil.move(src, dst)
+            return
+        
+        # Dot-prefixed so a copy left behind by a crash is hidden from
+        # list_downloads (and later removed by cleanup)
+        dst_dir, dst_name = os.path.split(dst)
+        tmp_path = os.path.join(dst_dir, f".{dst_name}.part")
+        src_fd = os.open(src, _OPEN_READ_FLAGS)
+        try:
+            st = os.fstat(src_fd)
+            dst_fd = os.open(
+                tmp_path,
+                os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_CLOEXEC,
+                stat_module.S_IMODE(st.st_mode)
+            )
+            try:
+                offset = 0
+                while offset < st.st_size:
+                    sent = os.sendfile(dst_fd, src_fd, offset, st.st_size - offset)
+                    if sent == 0:
+                        break
+                    offset += sent
+            except OSError as e:
+                if e.errno not in (errno.EINVAL, errno.ENOSYS):
+                    raise
+                sendfile_supported = False
+            else:
+                sendfile_supported = True
+            finally:
+                os.close(dst_fd)
+            
+            if not sendfile_supported:
+                shutil.copyfile(src, tmp_path)
+            elif offset < st.st_size:
+                # Source shrank mid-copy; keep it rather than publish a truncated file
+                raise OSError(
+                    errno.EIO,
+                    f"Short copy: {offset} of {st.st_size} bytes",
+                    src
+                )
+            os.replace(tmp_path, dst)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+        finally:
+            os.close(src_fd)
+        
+        os.unlink(src)
+    
+    def get_file_info(
+        self,
+        filepath: str,
+        stat: Optional[os.stat_result] = None
+    ) -> dict:
         """
         Get information about a file.
         
+        Args:
+            filepath: Path to the file
+            stat: Optional stat result already obtained for the file
+                  (e.g. from os.scandir) to avoid a second stat call
+        
         Returns:
             Dict with file metadata
         """
-        if not os.path.exists(filepath):
-            raise FileNotFoundError(f"File not found: {filepath}")
-        
-        stat = os.stat(filepath)
-        
-        return {
+        if stat is None:
+            if self._is_known_missing(filepath):
+                raise FileNotFoundError(f"File not found: {filepath}")
+            try:
+                stat = os.stat(filepath)
+            except FileNotFoundError:
+                self._mark_missing(filepath)
+                raise FileNotFoundError(f"File not found: {filepath}")
+        
+        validator = (stat.st_mtime_ns, stat.st_size)
+        with self._info_cache_lock:
+            cached = self._info_cache.get(filepath)
+            if cached is not None and cached[:2] == validator:
+                self._info_cache.move_to_end(filepath)
+                return dict(cached[2])
+        
+        info = {
             "path": filepath,
             "filename": os.path.basename(filepath),
             "size": stat.st_size,
-            "created_at": datetime.fromtimestamp(stat.st_ctime).isoformat(),
-            "modified_at": datetime.fromtimestamp(stat.st_mtime).isoformat(),
+            "created_at": time.strftime(_ISO_TIMESTAMP_FORMAT, time.localtime(stat.st_ctime)),
+            "modified_at": time.strftime(_ISO_TIMESTAMP_FORMAT, time.localtime(stat.st_mtime)),
         }
+        
+        with self._info_cache_lock:
+            self._info_cache[filepath] = (*validator, info)
+            self._info_cache.move_to_end(filepath)
+            if len(self._info_cache) > FILE_INFO_CACHE_SIZE:
+                self._info_cache.popitem(last=False)
+        
+        return dict(info)
+    
+    def invalidate_file_info(self, *filepaths: str) -> None:
+        """
+        Drop cached file info and missing-file entries for the given paths.
+        
+        FileManager calls this for its own writes; code that creates files
+        in the download directory by other means must call it too.
+        """
+        with self._info_cache_lock:
+            for filepath in filepaths:
+                self._info_cache.pop(filepath, None)
+                self._negative_cache.pop(filepath, None)
+    
+    def _is_known_missing(self, filepath: str) -> bool:
+        """Check whether filepath was recently found not to exist."""
+        with self._info_cache_lock:
+            missing_since = self._negative_cache.get(filepath)
+            if missing_since is None:
+                return False
+            if time.monotonic() - missing_since < NEGATIVE_CACHE_TTL:
+                return True
+            self._negative_cache.pop(filepath, None)
+            return False
+    
+    def _mark_missing(self, filepath: str) -> None:
+        """Remember that filepath does not exist, for NEGATIVE_CACHE_TTL seconds."""
+        now = time.monotonic()
+        with self._info_cache_lock:
+            self._negative_cache[filepath] = now
+            self._negative_cache.move_to_end(filepath)
+            # Entries are in time order, so expired ones are at the front
+            while self._negative_cache:
+                oldest = next(iter(self._negative_cache.values()))
+                if (
+                    len(self._negative_cache) <= FILE_INFO_CACHE_SIZE
+                    and now - oldest < NEGATIVE_CACHE_TTL
+                ):
+                    break
+                self._negative_cache.popitem(last=False)
     
     def list_downloads(self) -> list[dict]:
         """
@@ -154,43 +517,146 @@ class FileManager:
         """
         files = []
         
-        for filename in os.listdir(self.download_dir):
-            filepath = os.path.join(self.download_dir, filename)
-            if os.path.isfile(filepath):
+        # scandir reports the entry type from the directory read, so each file costs one stat call
+        with self._download_dir() as dir_fd, self._scan_download_dir(dir_fd) as it:
+            for entry in it:
                 try:
-                    files.append(self.get_file_info(filepath))
+                    # Skip hidden files such as in-progress .part copies
+                    if entry.name.startswith(".") or not entry.is_file(follow_symlinks=False):
+                        continue
+                    filepath = os.path.join(self.download_dir, entry.name)
+                    st = entry.stat()
+                    files.append((st.st_mtime_ns, self.get_file_info(filepath, st)))
                 except Exception as e:
                     logger.warning("Error getting file info", 
-                                  filename=filename, error=str(e))
+                                  filename=entry.name, error=str(e))
         
-        return sorted(files, key=lambda x: x["modified_at"], reverse=True)
+        # Sort on the raw mtime; modified_at is only second precision
+        files.sort(key=lambda pair: pair[0], reverse=True)
+        return [info for _, info in files]
     
     def cleanup_old_files(self, max_age_days: int = 30) -> int:
         """
         Remove files older than specified age.
         
+        When the background deletion worker is running, expired files are
+        queued for its next batch instead of being deleted inline.
+        
         Args:
-            max_age_days: Maximum age in days before deletion
+            max_age_days: Maximum age in days before deletion (at least 1)
             
         Returns:
-            Number of files deleted
+            Number of files deleted (or queued for deletion)
+            
+        Raises:
+            ValueError: If max_age_days is less than 1
         """
-        from datetime import timedelta
+        if max_age_days < 1:
+            raise ValueError(f"max_age_days must be at least 1, got {max_age_days}")
         
-        cutoff = datetime.now() - timedelta(days=max_age_days)
-        deleted = 0
+        expired = self._find_expired_files(max_age_days)
+        
+        if self._deletion_task is None or self._deletion_task.done():
+            return self._delete_files(expired)
         
-        for filename in os.listdir(self.download_dir):
-            filepath = os.path.join(self.download_dir, filename)
-            if os.path.isfile(filepath):
-                mtime = datetime.fromtimestamp(os.stat(filepath).st_mtime)
-                if mtime < cutoff:
-                    os.remove(filepath)
-                    deleted += 1
-                    logger.info("Deleted old file", filename=filename, age_days=(datetime.now() - mtime).days)
+        with self._pending_lock:
+            for item in expired:
+                self._pending_deletions[item[1]] = item
+        
+        logger.info("Queued old files for deletion", count=len(expired))
+        return len(expired)
+    
+    def _find_expired_files(self, max_age_days: int) -> list[tuple]:
+        """
+        Find files in the download directory older than max_age_days.
+        
+        Returns:
+            List of (inode, path, filename, age_days, cutoff_ts) tuples in
+            inode order
+        """
+        now_ts = time.time()
+        cutoff_ts = now_ts - max_age_days * 86400
+        
+        # Single scandir pass to collect expired files
+        expired = []
+        with self._download_dir() as dir_fd, self._scan_download_dir(dir_fd) as it:
+            for entry in it:
+                if not entry.is_file():
+                    continue
+                # Followed stat, as _delete_files re-checks: for a symlink
+                # entry.inode() would be the link's own inode
+                st = entry.stat()
+                if st.st_mtime < cutoff_ts:
+                    age_days = int((now_ts - st.st_mtime) // 86400)
+                    filepath = os.path.join(self.download_dir, entry.name)
+                    expired.append((st.st_ino, filepath, entry.name, age_days, cutoff_ts))
+        
+        # Unlink in inode order for better locality on large directories
+        expired.sort()
+        return expired
+    
+    def _delete_files(self, expired: list[tuple]) -> int:
+        """
+        Delete files found by _find_expired_files. Returns the number deleted.
+        
+        Each file is re-checked first, since queued deletions can run minutes
+        after the scan: it is skipped if it has been replaced (different
+        inode) or modified since (e.g. a regenerated consolidated report).
+        """
+        deleted = 0
+        with self._download_dir() as dir_fd:
+            for inode, filepath, filename, age_days, cutoff_ts in expired:
+                try:
+                    st = self._stat_download(filename, dir_fd)
+                    if st.st_ino != inode or st.st_mtime >= cutoff_ts:
+                        continue
+                    self._unlink_download(filename, dir_fd)
+                except FileNotFoundError:
+                    continue
+                self.invalidate_file_info(filepath)
+                deleted += 1
+                logger.info("Deleted old file", filename=filename, age_days=age_days)
         
         return deleted
     
+    async def start_deletion_worker(self, interval_seconds: float) -> None:
+        """Start the background task that deletes queued files in batches."""
+        if self._deletion_task is None or self._deletion_task.done():
+            self._deletion_task = asyncio.create_task(
+                self._deletion_worker(interval_seconds)
+            )
+    
+    async def stop_deletion_worker(self) -> None:
+        """Stop the background deletion task and delete anything still queued."""
+        if self._deletion_task is not None:
+            self._deletion_task.cancel()
+            try:
+                await self._deletion_task
+            except asyncio.CancelledError:
+                pass
+            self._deletion_task = None
+        
+        await self._flush_pending_deletions()
+    
+    async def _deletion_worker(self, interval_seconds: float) -> None:
+        """Periodically delete queued files off the request path."""
+        while True:
+            await asyncio.sleep(interval_seconds)
+            try:
+                await self._flush_pending_deletions()
+            except Exception as e:
+                logger.error("Error deleting queued files", error=str(e))
+    
+    async def _flush_pending_deletions(self) -> int:
+        """Delete all currently queued files in a worker thread."""
+        with self._pending_lock:
+            batch = sorted(self._pending_deletions.values())
+            self._pending_deletions.clear()
+        
+        if not batch:
+            return 0
+        return await asyncio.to_thread(self._delete_files, batch)
+    
     def validate_excel_file(self, filepath: str) -> bool:
         """
         Validate that a file appears to be a valid Excel file.
@@ -201,11 +667,23 @@ class FileManager:
         Returns:
             True if file appears valid
         """
-        if not os.path.exists(filepath):
+        if self._is_known_missing(filepath):
+            return False
+        
+        # One stat call covers existence, type and size
+        try:
+            st = os.stat(filepath)
+        except FileNotFoundError:
+            self._mark_missing(filepath)
+            return False
+        except OSError:
+            return False
+        
+        if not stat_module.S_ISREG(st.st_mode):
             return False
         
         # Check file size (should be at least a few KB for Excel)
-        size = os.stat(filepath).st_size
+        size = st.st_size
         if size < 1000:  # Less than 1KB is suspicious
             logger.warning("File too small to be valid Excel", 
                           filepath=filepath, size=size)
@@ -216,14 +694,20 @@ class FileManager:
             logger.warning("File does not have Excel extension", filepath=filepath)
             return False
         
-        # Check magic bytes for xlsx (ZIP format)
+        # Check magic bytes for xlsx (ZIP format) with a single unbuffered read
         try:
-            with open(filepath, 'rb') as f:
-                header = f.read(4)
-                # XLSX files are ZIP archives starting with PK
-                if header[:2] != b'PK':
-                    logger.warning("File does not have valid Excel header", filepath=filepath)
-                    return False
+            fd = os.open(filepath, _OPEN_READ_FLAGS)
+            try:
+                if hasattr(os, "pread"):
+                    header = os.pread(fd, 4, 0)
+                else:
+                    header = os.read(fd, 4)
+            finally:
+                os.close(fd)
+            # XLSX files are ZIP archives starting with PK
+            if header[:2] != b'PK':
+                logger.warning("File does not have valid Excel header", filepath=filepath)
+                return False
         except Exception as e:
             logger.error("Error reading file", filepath=filepath, error=str(e))
             return False
@@ -234,7 +718,9 @@ class FileManager:
         self,
         file_paths: List[str],
         output_filename: str,
-        sheet_names: Optional[List[str]] = None
+        sheet_names: Optional[List[str]] = None,
+        preserve_styles: bool = True,
+        use_calamine: bool = False
     ) -> str:
         """
         Consolidate multiple Excel files into a single file.
@@ -245,6 +731,13 @@ class FileManager:
             file_paths: List of paths to Excel files to consolidate
             output_filename: Name for the consolidated output file
             sheet_names: Optional list of custom sheet names (one per file)
+            preserve_styles: Copy formatting, merged cells and dimensions.
+                        When False, only cell values are copied, streaming
+                        sources in read-only mode into a write-only output.
+            use_calamine: With preserve_styles=False, parse sources with the
+                        optional python-calamine package. Faster, but copies
+                        cached formula results instead of formulas and
+                        doesn't keep int/datetime types exactly.
                         
         Returns:
             Path to the consolidated file
@@ -260,48 +753,63 @@ class FileManager:
                    file_count=len(file_paths),
                    output=output_filename)
         
-        output_wb = Workbook()
+        # Write-only workbooks stream to disk but can't hold formatting
+        output_wb = Workbook(write_only=not preserve_styles)
         default_sheet = output_wb.active
         
+        if use_calamine and CalamineWorkbook is None:
+            logger.warning("python-calamine not installed, reading with openpyxl")
+        
+        file_payloads = self._load_sheet_payloads(file_paths, preserve_styles, use_calamine)
+        
+        used_names = {sheet.title for sheet in output_wb.worksheets}
+        name_counter: dict[str, int] = {}
+        
         sheet_index = 0
         for file_idx, file_path in enumerate(file_paths):
-            try:
-                source_wb = load_workbook(file_path, data_only=False)
-                
-                for source_sheet in source_wb.worksheets:
-                    if sheet_names and file_idx < len(sheet_names):
-                        if len(source_wb.worksheets) > 1:
-                            new_sheet_name = f"{sheet_names[file_idx]}_{source_sheet.title}"
-                        else:
-                            new_sheet_name = sheet_names[file_idx]
+            sheet_payloads = file_payloads[file_idx]
+            
+            # Per-file naming inputs, computed once rather than per sheet
+            has_multiple = len(sheet_payloads) > 1
+            if sheet_names and file_idx < len(sheet_names):
+                custom_name = sheet_names[file_idx]
+            else:
+                custom_name = None
+                base_name = os.path.splitext(os.path.basename(file_path))[0]
+                short_base = base_name[:15]
+            
+            for payload in sheet_payloads:
+                if custom_name is not None:
+                    if has_multiple:
+                        new_sheet_name = f"{custom_name}_{payload['title']}"
                     else:
-                        base_name = os.path.splitext(os.path.basename(file_path))[0]
-                        short_base = base_name[:15] if len(base_name) > 15 else base_name
-                        new_sheet_name = f"{short_base}_{source_sheet.title}"
-                    
-                    new_sheet_name = self._sanitize_sheet_name(new_sheet_name)
-                    new_sheet_name = self._make_unique_sheet_name(output_wb, new_sheet_name)
-                    
-                    new_sheet = output_wb.create_sheet(title=new_sheet_name)
-                    self._copy_sheet_data(source_sheet, new_sheet)
-                    
-                    sheet_index += 1
-                    logger.debug("Copied sheet", 
-                               source=source_sheet.title,
-                               target=new_sheet_name)
+                        new_sheet_name = custom_name
+                else:
+                    new_sheet_name = f"{short_base}_{payload['title']}"
                 
-                source_wb.close()
+                new_sheet_name = self._sanitize_sheet_name(new_sheet_name)
+                new_sheet_name = self._make_unique_sheet_name(
+                    new_sheet_name, used_names, name_counter
+                )
                 
-            except Exception as e:
-                logger.error("Error processing file", file=file_path, error=str(e))
-                raise
-        
-        if sheet_index > 0 and default_sheet.title == "Sheet":
+                new_sheet = output_wb.create_sheet(title=new_sheet_name)
+                self._copy_sheet_data(payload, new_sheet)
+                
+                sheet_index += 1
+                logger.debug("Copied sheet", 
+                           source=payload["title"],
+                           target=new_sheet_name)
+        
+        if default_sheet is None:
+            if sheet_index == 0:
+                output_wb.create_sheet(title="Sheet")
+        elif sheet_index > 0 and default_sheet.title == "Sheet":
             output_wb.remove(default_sheet)
         
         output_path = os.path.join(self.download_dir, output_filename)
         output_wb.save(output_path)
         output_wb.close()
+        self.invalidate_file_info(output_path)
         
         logger.info("Consolidation complete", 
                    output_path=output_path,
@@ -309,60 +817,154 @@ class FileManager:
         
         return output_path
     
+    def _load_sheet_payloads(
+        self,
+        file_paths: List[str],
+        preserve_styles: bool = True,
+        use_calamine: bool = False
+    ) -> list[list[dict]]:
+        """
+        Parse the source workbooks, in parallel when the sources are large.
+        
+        openpyxl parsing is CPU-bound pure Python, so large batches are spread
+        over a shared worker pool. Small ones (the common case) are parsed
+        inline. Results are returned in file_paths order.
+        """
+        max_workers = min(len(file_paths), os.cpu_count() or 1)
+        
+        if max_workers <= 1 or self._total_size(file_paths) < PARALLEL_PARSE_MIN_BYTES:
+            results = []
+            for file_path in file_paths:
+                try:
+                    results.append(_extract_sheet_payloads(file_path, preserve_styles, use_calamine))
+                except Exception as e:
+                    logger.error("Error processing file", file=file_path, error=str(e))
+                    raise
+            return results
+        
+        executor = self._get_parse_executor()
+        futures = [
+            executor.submit(_extract_sheet_payloads, path, preserve_styles, use_calamine)
+            for path in file_paths
+        ]
+        
+        results = []
+        for file_path, future in zip(file_paths, futures):
+            try:
+                results.append(future.result())
+            except Exception as e:
+                logger.error("Error processing file", file=file_path, error=str(e))
+                for pending in futures:
+                    pending.cancel()
+                if isinstance(e, BrokenProcessPool):
+                    # A dead worker poisons the pool; start a fresh one next time
+                    self._discard_parse_executor(executor)
+                raise
+        return results
+    
+    def _total_size(self, file_paths: List[str]) -> int:
+        """Combined size of the given files; unreadable ones count as zero."""
+        total = 0
+        for file_path in file_paths:
+            try:
+                total += os.path.getsize(file_path)
+            except OSError:
+                pass
+        return total
+    
+    def _get_parse_executor(self) -> ProcessPoolExecutor:
+        """Return the shared parse pool, starting it on first use."""
+        with self._parse_executor_lock:
+            if self._parse_executor is None:
+                # spawn rather than fork: the parent runs an event loop and Playwright threads
+                self._parse_executor = ProcessPoolExecutor(
+                    max_workers=os.cpu_count() or 1,
+                    mp_context=multiprocessing.get_context("spawn")
+                )
+            return self._parse_executor
+    
+    def _discard_parse_executor(self, executor: ProcessPoolExecutor) -> None:
+        """Drop the shared parse pool if it is still the given executor."""
+        with self._parse_executor_lock:
+            if self._parse_executor is executor:
+                self._parse_executor = None
+        executor.shutdown(wait=False, cancel_futures=True)
+    
     def _sanitize_sheet_name(self, name: str) -> str:
         """Sanitize a string for use as Excel sheet name (max 31 chars)."""
-        invalid_chars = '\\/*?:[]'
-        result = name
-        for char in invalid_chars:
-            result = result.replace(char, '_')
-        return result[:31]
+        return name.translate(_SHEET_NAME_TRANS)[:31]
     
-    def _make_unique_sheet_name(self, workbook: Workbook, name: str) -> str:
-        """Ensure sheet name is unique in workbook."""
-        existing_names = [sheet.title for sheet in workbook.worksheets]
+    def _make_unique_sheet_name(
+        self,
+        name: str,
+        used_names: set[str],
+        name_counter: dict[str, int]
+    ) -> str:
+        """
+        Ensure sheet name is unique among used_names, and record it there.
         
-        if name not in existing_names:
+        name_counter remembers the last suffix tried per base name, so
+        repeated collisions don't rescan suffixes that are already taken.
+        """
+        if name not in used_names:
+            used_names.add(name)
             return name
         
-        counter = 1
+        counter = name_counter.get(name, 0)
         while True:
+            counter += 1
             suffix = f"_{counter}"
             max_base_len = 31 - len(suffix)
             new_name = f"{name[:max_base_len]}{suffix}"
-            if new_name not in existing_names:
+            if new_name not in used_names:
+                name_counter[name] = counter
+                used_names.add(new_name)
                 return new_name
-            counter += 1
     
-    def _copy_sheet_data(self, source_sheet, target_sheet) -> None:
-        """Copy all data and formatting from source sheet to target sheet."""
-        from openpyxl.cell.cell import MergedCell
-        
-        # Copy cell data first (before merging)
-        for row_idx, row in enumerate(source_sheet.iter_rows(), 1):
-            for col_idx, cell in enumerate(row, 1):
-                # Skip MergedCell objects - they don't have values
-                if isinstance(cell, MergedCell):
-                    continue
-                    
-                target_cell = target_sheet.cell(row=row_idx, column=col_idx)
-                target_cell.value = cell.value
-                
-                if cell.has_style:
-                    target_cell.font = cell.font.copy()
-                    target_cell.fill = cell.fill.copy()
-                    target_cell.border = cell.border.copy()
-                    target_cell.alignment = cell.alignment.copy()
-                    target_cell.number_format = cell.number_format
+    def _copy_sheet_data(self, payload: dict, target_sheet) -> None:
+        """Write a sheet payload's data and formatting into the target sheet."""
+        # Values-only payloads are appended row by row
+        if "rows" in payload:
+            for row in payload["rows"]:
+                target_sheet.append(row)
+            return
+        
+        styles = payload["styles"]
+        # Resolved target StyleArray per source style, so each distinct style
+        # is registered in the output workbook's style tables only once
+        style_arrays = {}
+        
+        # Copy cell data first (before merging). Cells are built directly into
+        # the sheet's cell dict, bypassing the coordinate-resolving cell() accessor
+        cells = target_sheet._cells
+        for row_idx, col_idx, value, style_idx in payload["cells"]:
+            style_array = style_arrays.get(style_idx)
+            target_cell = Cell(
+                target_sheet, row=row_idx, column=col_idx,
+                value=value, style_array=style_array
+            )
+            cells[(row_idx, col_idx)] = target_cell
+            
+            if style_idx is None or style_array is not None:
+                continue
+            
+            font, fill, border, alignment, number_format = styles[style_idx]
+            target_cell.font = font
+            target_cell.fill = fill
+            target_cell.border = border
+            target_cell.alignment = alignment
+            target_cell.number_format = number_format
+            style_arrays[style_idx] = copy(target_cell._style)
         
         # Copy merged cells after data
-        for merged_range in source_sheet.merged_cells.ranges:
-            target_sheet.merge_cells(str(merged_range))
+        for merged_range in payload["merged_ranges"]:
+            target_sheet.merge_cells(merged_range)
         
-        for col_letter, col_dim in source_sheet.column_dimensions.items():
-            target_sheet.column_dimensions[col_letter].width = col_dim.width
+        for col_letter, width in payload["column_widths"].items():
+            target_sheet.column_dimensions[col_letter].width = width
         
-        for row_num, row_dim in source_sheet.row_dimensions.items():
-            target_sheet.row_dimensions[row_num].height = row_dim.height
+        for row_num, height in payload["row_heights"].items():
+            target_sheet.row_dimensions[row_num].height = height
 
 
 # Singleton instance
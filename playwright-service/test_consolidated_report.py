@@ -11,9 +11,15 @@ Usage:
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 import json
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:  # optional: faster JSON encode/decode
+    orjson = None
+
 API_BASE_URL = "http://localhost:8000/api"
 TENANT_NAME = "Marsill Pty Ltd"
 TENANT_ID = "!mkK34"
@@ -24,12 +30,32 @@ TEST_PERIODS = [
     {"month": 12, "year": 2025, "name": "December 2025"},
 ]
 
+# Reuse one connection pool for all calls.
+# Periods still run one at a time: the service drives a single shared
+# browser page, so concurrent report requests would interfere.
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=1))
+
+
+def json_loads(content: bytes):
+    """Parse a JSON response body, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def json_dumps(obj) -> bytes:
+    """Encode a JSON request body, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
 
 def check_authentication():
     """Check if the browser is authenticated."""
     try:
-        response = requests.get(f"{API_BASE_URL}/auth/status")
-        auth_status = response.json()
+        response = SESSION.get(f"{API_BASE_URL}/auth/status")
+        auth_status = json_loads(response.content)
         if auth_status.get("logged_in"):
             print("✓ Authenticated")
             return True
@@ -61,13 +87,14 @@ def test_consolidated_report(month: int, year: int, period_name: str):
     print("This may take 2-3 minutes...")
     
     try:
-        response = requests.post(
+        response = SESSION.post(
             f"{API_BASE_URL}/reports/consolidated",
-            json=request_body,
+            data=json_dumps(request_body),
+            headers={"Content-Type": "application/json"},
             timeout=300
         )
         
-        result = response.json()
+        result = json_loads(response.content)
         
         print(f"\n{'-'*40}")
         print("RESULT")